@@ -8,44 +8,62 @@ Features:
 - Watches ./pdf/ for new PDFs (watchdog) or runs one-shot "catch-up".
 - Explodes PDFs with mutool extract into ./pdf-objects/<safe>/
 - Hashes every extracted object; appends one row per object to objects.tsv (22 columns)
-- Dedup-copies unique objects to ./hashed-objects/<sha256>.<ext> (first extension wins)
+- Dedup-stores unique objects as ./hashed-objects/<sha256>.<ext> (hard link, else copy; first extension wins)
 - Uses processed.tsv + per-PDF .processed.sha + in-flight lock file to prevent reprocessing
 - Parses MCRO_* filename into Case Number / Filing Type / Filing Date (first 3 tokens after MCRO_)
 - Extracts Author/Creator via exiftool; signatures (CN/time/ranges) via pdfsig (up to 4 blocks)
-- Rebuilds hash-count.tsv (from column #4 = SHA256) after each PDF
+- Keeps hash-count.tsv (from column #4 = SHA256) current after each catch-up pass / watched PDF
 """
 import argparse
 import hashlib
+import mmap
+import multiprocessing
 import os
 import re
 import shutil
+import struct
 import subprocess
 import sys
+import threading
 import time
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 # Optional: watchdog for live monitoring
 try:
     from watchdog.observers import Observer
+    from watchdog.observers.polling import PollingObserver
     from watchdog.events import FileSystemEventHandler
     HAS_WATCHDOG = True
 except Exception:
     HAS_WATCHDOG = False
+    FileSystemEventHandler = object  # keeps PdfWatchHandler importable; unused without watchdog
 
 ROOT = Path.cwd()
 PDF_DIR = ROOT / "pdf"
 OBJ_DIR = ROOT / "pdf-objects"
 HASHED_DIR = ROOT / "hashed-objects"
+OBJ_DIR_STR = str(OBJ_DIR)  # for os.path calls in the per-object loop
 
 OBJECTS_TSV = ROOT / "objects.tsv"
 HASH_COUNT_TSV = ROOT / "hash-count.tsv"
 PROCESSED_TSV = ROOT / "processed.tsv"
+FONT_NAMES_TSV = ROOT / "font-names.tsv"
+PROCESSED_SAMPLES_TSV = ROOT / "processed-samples.tsv"  # <sample sha>\t<sha>, backfilled
 
 LOCK_DIR = ROOT / ".locks"
 INFLIGHT_DIR = LOCK_DIR / "inflight"
+SCAN_PARTS_DIR = LOCK_DIR / "scan-parts"
+
+# Where process_pdf() appends rows / ledger lines / font names / samples. Catch-up
+# workers point these at per-PDF part files under SCAN_PARTS_DIR (see merge_scan_parts).
+_OBJECTS_OUT = OBJECTS_TSV
+_PROCESSED_OUT = PROCESSED_TSV
+_FONT_NAMES_OUT = FONT_NAMES_TSV
+_SAMPLES_OUT = PROCESSED_SAMPLES_TSV
 
 # Schema: 22 columns
 OBJECTS_HEADER = (
@@ -60,10 +78,22 @@ OLD_HEADER_5 = "SHA256 Hash Value\tPdf File Name\tPdf Internal Object Path\tObje
 
 PDF_EXT_RE = re.compile(r"\.pdf$", re.IGNORECASE)
 
-def run_cmd(cmd: List[str]) -> Tuple[int, str, str]:
-    """Run a command and return (rc, stdout, stderr)."""
+# Files up to this size are hashed from a single read instead of a memory map
+SMALL_FILE_BYTES = 64 * 1024
+
+# file_sample_sha() reads this many bytes from each end of a PDF
+SAMPLE_BYTES = 1024 * 1024
+
+# Skip PDFs whose sample SHA is already in processed.tsv without a full hash (--sample-skip)
+SAMPLE_SKIP = False
+
+# Threads used to hash the objects extracted from one PDF
+HASH_WORKERS = os.cpu_count() or 4
+
+def run_cmd(cmd: List[str], cwd: Optional[Path] = None) -> Tuple[int, str, str]:
+    """Run a command (optionally in cwd) and return (rc, stdout, stderr)."""
     try:
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        proc = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, check=False)
         return proc.returncode, proc.stdout, proc.stderr
     except FileNotFoundError:
         return 127, "", f"Command not found: {cmd[0]}"
@@ -113,22 +143,75 @@ def ensure_layout() -> None:
     if not PROCESSED_TSV.exists():
         PROCESSED_TSV.write_text("", encoding="utf-8")
 
+_SAFE_NAME_TABLE = str.maketrans({" ": "_", "/": "_"})
+
 def safe_name(pdf_name: str) -> str:
-    base = re.sub(r"\.pdf$", "", pdf_name, flags=re.IGNORECASE)
-    base = os.path.basename(base)
-    return base.replace(" ", "_").replace("/", "_")
+    base = os.path.basename(pdf_name)
+    if base[-4:].lower() == ".pdf":
+        base = base[:-4]
+    return base.translate(_SAFE_NAME_TABLE)
+
+def _stream_sha256(f, bufsize: int) -> str:
+    """SHA-256 of an open binary file; the read/update loop runs in C where available (3.11+)."""
+    if hasattr(hashlib, "file_digest"):
+        return hashlib.file_digest(f, "sha256").hexdigest()
+    # <3.11: reuse one buffer instead of allocating a bytes object per chunk
+    h = hashlib.sha256()
+    buf = bytearray(bufsize)
+    view = memoryview(buf)
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        h.update(view[:n])
+    return h.hexdigest()
+
+def file_sha256(path: Union[str, Path], size: Optional[int] = None, bufsize: int = 4 * 1024 * 1024) -> str:
+    """SHA-256 of a file: one read for small objects, a memory map for the rest.
 
-def file_sha256(path: Path, bufsize: int = 1024 * 1024) -> str:
+    Pass size when it is already known (e.g. from a DirEntry) to skip a stat().
+    """
+    if size is None:
+        size = os.stat(path).st_size
+    if size <= SMALL_FILE_BYTES:
+        # most extracted glyph/image objects land here; also covers empty files,
+        # which mmap refuses to map
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    with open(path, "rb", buffering=0) as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        except (OSError, ValueError):
+            # not mappable (special file, exotic filesystem): stream it instead
+            return _stream_sha256(f, bufsize)
+
+def file_sample_sha(path: Path, size: Optional[int] = None) -> str:
+    """SHA-256 of the first and last SAMPLE_BYTES plus the size; covers the whole file up to 2 MiB."""
+    if size is None:
+        size = path.stat().st_size
     h = hashlib.sha256()
     with path.open("rb") as f:
-        while True:
-            b = f.read(bufsize)
-            if not b:
-                break
-            h.update(b)
+        h.update(f.read(SAMPLE_BYTES))
+        if size > SAMPLE_BYTES:
+            f.seek(max(size - SAMPLE_BYTES, SAMPLE_BYTES))
+            h.update(f.read(SAMPLE_BYTES))
+    h.update(struct.pack("<Q", size))
     return h.hexdigest()
 
-def wait_for_quiet_file(path: Path, tries: int = 10, delay: float = 0.3) -> None:
+def file_sha256_and_sample(path: Path, size: int) -> Tuple[str, str]:
+    """file_sha256() and file_sample_sha() from a single read, for files up to 2 * SAMPLE_BYTES.
+
+    The sample covers the whole file at that size, so it is the full digest plus the size.
+    """
+    with path.open("rb") as f:
+        h = hashlib.sha256(f.read())
+    sha = h.hexdigest()
+    h.update(struct.pack("<Q", size))
+    return sha, h.hexdigest()
+
+def wait_for_quiet_file(path: Path, tries: int = 10, delay: float = 0.05) -> None:
+    """Return once two stat() calls delay apart agree on the size (at most tries polls)."""
     last = -1
     for _ in range(tries):
         if not path.exists():
@@ -140,20 +223,54 @@ def wait_for_quiet_file(path: Path, tries: int = 10, delay: float = 0.3) -> None
         last = size
         time.sleep(delay)
 
-def load_processed_shas() -> set:
-    shas = set()
+# processed.tsv column #1 (PDF SHA256) and column #6 (sample SHA), loaded once and
+# kept current by record_processed()
+_PROCESSED_SHAS: Optional[set] = None
+_PROCESSED_SAMPLES: Optional[set] = None
+
+def load_processed_ledger() -> Tuple[set, set]:
+    """Read columns #1 and #6 of processed.tsv, plus the samples backfilled into
+    processed-samples.tsv; only those columns are decoded."""
+    shas, samples = set(), set()
     if PROCESSED_TSV.exists():
-        with PROCESSED_TSV.open("r", encoding="utf-8", errors="ignore") as f:
+        with PROCESSED_TSV.open("rb") as f:
+            for line in f:
+                parts = line.rstrip(b"\r\n").split(b"\t")
+                if parts[0]:
+                    shas.add(parts[0].decode("utf-8", errors="ignore"))
+                if len(parts) >= 6 and parts[5]:
+                    samples.add(parts[5].decode("utf-8", errors="ignore"))
+    if PROCESSED_SAMPLES_TSV.exists():
+        with PROCESSED_SAMPLES_TSV.open("rb") as f:
             for line in f:
-                line = line.rstrip("\n")
-                if not line:
-                    continue
-                parts = line.split("\t")
-                if parts and parts[0]:
-                    shas.add(parts[0])
-    return shas
+                sample = line.split(b"\t", 1)[0].strip()
+                if sample:
+                    samples.add(sample.decode("utf-8", errors="ignore"))
+    return shas, samples
+
+def _ensure_processed_ledger() -> None:
+    global _PROCESSED_SHAS, _PROCESSED_SAMPLES
+    if _PROCESSED_SHAS is None:
+        _PROCESSED_SHAS, _PROCESSED_SAMPLES = load_processed_ledger()
+
+def processed_shas() -> set:
+    """Cached set of processed PDF SHAs (read from processed.tsv on first use)."""
+    _ensure_processed_ledger()
+    return _PROCESSED_SHAS
+
+def processed_samples() -> set:
+    """Cached set of processed PDF sample SHAs (see file_sample_sha)."""
+    _ensure_processed_ledger()
+    return _PROCESSED_SAMPLES
+
+# Set in catch-up workers to the locks present before the pool started: a sibling
+# worker's lock on the same content is expected there, and merge_scan_parts() keeps
+# the first copy by PDF order, as a serial pass would
+_INFLIGHT_AT_START: Optional[set] = None
 
 def has_inflight(sha: str) -> bool:
+    if _INFLIGHT_AT_START is not None:
+        return sha in _INFLIGHT_AT_START
     return (INFLIGHT_DIR / f"{sha}.lock").exists()
 
 def mark_inflight(sha: str) -> None:
@@ -165,10 +282,19 @@ def clear_inflight(sha: str) -> None:
     except Exception:
         pass
 
-def record_processed(sha: str, pdf_name: str, bytes_size: int, mtime_epoch: int) -> None:
+def record_processed(sha: str, pdf_name: str, bytes_size: int, mtime_epoch: int, sample: str = "") -> None:
     iso = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-    with PROCESSED_TSV.open("a", encoding="utf-8") as f:
-        f.write(f"{sha}\t{pdf_name}\t{bytes_size}\t{mtime_epoch}\t{iso}\n")
+    with _PROCESSED_OUT.open("a", encoding="utf-8") as f:
+        f.write(f"{sha}\t{pdf_name}\t{bytes_size}\t{mtime_epoch}\t{iso}\t{sample}\n")
+    processed_shas().add(sha)
+    if sample:
+        processed_samples().add(sample)
+
+def record_sample(sha: str, sample: str) -> None:
+    """Backfill the sample SHA of a PDF recorded without one (pre-sample processed.tsv rows)."""
+    with _SAMPLES_OUT.open("a", encoding="utf-8") as f:
+        f.write(f"{sample}\t{sha}\n")
+    processed_samples().add(sample)
 
 def parse_mcro_fields(pdf_name: str) -> Tuple[str, str, str]:
     """If name starts with MCRO_, return (case, filing_type, filing_date); else blanks."""
@@ -181,32 +307,49 @@ def parse_mcro_fields(pdf_name: str) -> Tuple[str, str, str]:
         return parts[1], parts[2], parts[3]
     return "", "", ""
 
-SIG_BLOCK_RE = re.compile(r"^Signature\s#([1-4]):")
-CN_RE = re.compile(r"Signer\sCertificate\sCommon\sName:\s(.*)$")
-TIME_RE = re.compile(r"Signing\sTime:\s(.*)$")
-RANGE_RE = re.compile(r"Signed\sRanges:\s(.*)$")
+# pdfsig field labels are fixed literals (after stripping the "  - " bullet),
+# so they are matched with str.startswith and sliced at precomputed lengths
+SIG_BLOCK_PREFIX = "Signature #"
+SIG_BLOCK_LEN = len(SIG_BLOCK_PREFIX)
+SIG_BLOCK_NUMS = {"1:": 1, "2:": 2, "3:": 3, "4:": 4}
+SIG_FIELD_PREFIXES = tuple(
+    (prefix, len(prefix), key)
+    for prefix, key in (
+        ("Signer Certificate Common Name:", "CN"),
+        ("Signing Time:", "TIME"),
+        ("Signed Ranges:", "RANGE"),
+    )
+)
+
+_MONTHS = {
+    m: i for i, m in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), 1
+    )
+}
 
 def normalize_sig_time(raw: str) -> str:
     """
     Try to convert 'Apr 11 2024 08:35:56' to '2024-04-11 08:35:56'.
     Fall back to raw if parsing fails.
     """
+    tokens = raw.split()
+    # fast path for pdfsig's usual 'Mon DD YYYY HH:MM:SS' shape (no strptime, no exceptions);
+    # trailing tokens such as a timezone are dropped
+    if len(tokens) >= 4 and tokens[0] in _MONTHS and len(tokens[2]) == 4:
+        hms = tokens[3].split(":")
+        if len(hms) == 3 and tokens[1].isdigit() and tokens[2].isdigit() and all(p.isdigit() for p in hms):
+            try:
+                dt = datetime(int(tokens[2]), _MONTHS[tokens[0]], int(tokens[1]),
+                              int(hms[0]), int(hms[1]), int(hms[2]))
+                return dt.isoformat(" ")
+            except ValueError:
+                pass  # e.g. Feb 30: let strptime have the final say
     for fmt in ("%b %d %Y %H:%M:%S", "%b %d %Y %H:%M", "%c"):
         try:
             dt = datetime.strptime(raw.strip(), fmt)
             return dt.strftime("%Y-%m-%d %H:%M:%S")
         except Exception:
             pass
-    # some locales may include timezone or other text; attempt a mild cleanup
-    try:
-        tokens = raw.strip().split()
-        # keep first 5 tokens: Mon DD YYYY HH:MM:SS
-        if len(tokens) >= 5:
-            s = " ".join(tokens[:5])
-            dt = datetime.strptime(s, "%b %d %Y %H:%M:%S")
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
-    except Exception:
-        pass
     return raw.strip()
 
 def parse_pdfsig(pdf_path: Path) -> Dict[str, str]:
@@ -222,24 +365,20 @@ def parse_pdfsig(pdf_path: Path) -> Dict[str, str]:
 
     cur = 0
     for line in out.splitlines():
-        m = SIG_BLOCK_RE.match(line.strip())
-        if m:
-            cur = int(m.group(1))
-            continue
+        s = line.strip()
+        if s.startswith(SIG_BLOCK_PREFIX):
+            num = SIG_BLOCK_NUMS.get(s[SIG_BLOCK_LEN:SIG_BLOCK_LEN + 2])
+            if num:
+                cur = num
+                continue
         if not (1 <= cur <= 4):
             continue
-        m = CN_RE.search(line)
-        if m:
-            sigs[f"SIG{cur}_CN"] = m.group(1).strip()
-            continue
-        m = TIME_RE.search(line)
-        if m:
-            sigs[f"SIG{cur}_TIME"] = normalize_sig_time(m.group(1))
-            continue
-        m = RANGE_RE.search(line)
-        if m:
-            sigs[f"SIG{cur}_RANGE"] = m.group(1).strip()
-            continue
+        s = s.lstrip("- ")
+        for prefix, n, key in SIG_FIELD_PREFIXES:
+            if s.startswith(prefix):
+                value = s[n:]
+                sigs[f"SIG{cur}_{key}"] = normalize_sig_time(value) if key == "TIME" else value.strip()
+                break
     return sigs
 
 def get_author_creator(pdf_path: Path) -> Tuple[str, str]:
@@ -261,9 +400,9 @@ def get_author_creator(pdf_path: Path) -> Tuple[str, str]:
 
 FONT_EXTS = {".ttf", ".otf", ".ttc", ".woff", ".woff2", ".pfb", ".pfa"}
 
-def get_font_name(obj_path: Path) -> str:
+def get_font_name(obj_path: Union[str, Path]) -> str:
     """Best-effort font name via otfinfo or fc-scan; blank if unavailable."""
-    ext = obj_path.suffix.lower()
+    ext = os.path.splitext(obj_path)[1].lower()
     if ext not in FONT_EXTS:
         return ""
     rc, out, err = run_cmd(["otfinfo", "-i", str(obj_path)])
@@ -276,122 +415,251 @@ def get_font_name(obj_path: Path) -> str:
         return out.splitlines()[0].strip()
     return ""
 
-def copy_object_if_new_by_hash(src: Path, sha: str, dest_dir: Path) -> None:
-    """Copy obj to hashed-objects/<sha>.<ext> if not already present under any extension."""
-    # Check <sha> and <sha>.*
-    base = dest_dir / sha
-    if base.exists():
+def iter_objects(root: Path) -> Iterator[os.DirEntry]:
+    """Yield every extracted object file under root (minus the stamp) via os.scandir."""
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name != ".processed.sha":
+                    yield entry
+
+# object SHA256 -> font name; persisted (non-blank names only) in font-names.tsv so
+# fonts shared across PDFs are probed with otfinfo/fc-scan once
+_FONT_CACHE: Optional[Dict[str, str]] = None
+_FONT_CACHE_LOCK = threading.Lock()
+
+def load_font_cache(path: Path = FONT_NAMES_TSV) -> Dict[str, str]:
+    """Read font-names.tsv (<sha256>\t<font name>)."""
+    cache = {}
+    if path.exists():
+        with path.open("r", encoding="utf-8", errors="ignore") as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t", 1)
+                if len(parts) == 2 and parts[0]:
+                    cache[parts[0]] = parts[1]
+    return cache
+
+def get_font_name_cached(obj_path: str, sha: str) -> str:
+    """get_font_name() memoized by content hash; safe to call from worker threads."""
+    global _FONT_CACHE
+    with _FONT_CACHE_LOCK:
+        if _FONT_CACHE is None:
+            _FONT_CACHE = load_font_cache()
+        if sha in _FONT_CACHE:
+            return _FONT_CACHE[sha]
+    name = get_font_name(obj_path)
+    with _FONT_CACHE_LOCK:
+        if sha in _FONT_CACHE:
+            return _FONT_CACHE[sha]  # probed meanwhile by another hashing thread
+        _FONT_CACHE[sha] = name
+        # blanks stay in memory only, so installing the font tools later still helps
+        if name:
+            with _FONT_NAMES_OUT.open("a", encoding="utf-8") as f:
+                f.write(f"{sha}\t{name}\n")
+    return name
+
+def hash_object(entry: os.DirEntry) -> Tuple[str, str, str, str]:
+    """Hash one extracted object and probe its font name; returns (path, sha, ext, font_name)."""
+    # plain strings throughout: this runs once per extracted object
+    obj_path = entry.path
+    h = file_sha256(obj_path, entry.stat().st_size)
+    ext = os.path.splitext(entry.name)[1].lower()
+    if len(ext) > 11:
+        ext = ""
+    font_name = get_font_name_cached(obj_path, h) if ext in FONT_EXTS else ""
+    return obj_path, h, ext, font_name
+
+# dest dir -> {sha: stored file name}, listed once per dir and kept current by
+# copy_object_if_new_by_hash()
+_HASHED_INDEX: Dict[Path, Dict[str, str]] = {}
+
+def load_hashed_index(dest_dir: Path) -> Dict[str, str]:
+    """Map <sha> -> file name for every <sha> / <sha>.<ext> in dest_dir (one directory read)."""
+    index = {}
+    try:
+        with os.scandir(dest_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.endswith(".tmp"):
+                    continue  # leftover of an interrupted copy
+                index.setdefault(name.split(".", 1)[0], name)
+    except FileNotFoundError:
+        pass
+    return index
+
+def hashed_index(dest_dir: Path) -> Dict[str, str]:
+    """Cached index of dest_dir (listed on first use)."""
+    index = _HASHED_INDEX.get(dest_dir)
+    if index is None:
+        index = _HASHED_INDEX[dest_dir] = load_hashed_index(dest_dir)
+    return index
+
+def copy_object_if_new_by_hash(src: Union[str, Path], sha: str, dest_dir: Path) -> None:
+    """Link/copy obj to hashed-objects/<sha>.<ext> if not already present under any extension."""
+    # <sha> or <sha>.* already stored?
+    index = hashed_index(dest_dir)
+    if sha in index:
         return
-    for cand in dest_dir.glob(f"{sha}.*"):
-        if cand.exists():
-            return
-    ext = src.suffix.lower()
+    ext = os.path.splitext(src)[1].lower()
     if len(ext) > 11:
         ext = ""  # ignore insane ext length
     dest = dest_dir / f"{sha}{ext}"
-    tmp = dest.with_suffix(dest.suffix + ".tmp")
-    tmp.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, tmp)
-    tmp.replace(dest)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        # same volume: a hard link stores the object without copying its bytes (atomic)
+        os.link(src, dest)
+    except FileExistsError:
+        pass  # stored meanwhile by someone else
+    except OSError:
+        # cross-device, no permission, or no hard-link support (e.g. FAT)
+        tmp = dest.with_name(f"{dest.name}.{os.getpid()}.tmp")  # unique per catch-up worker
+        shutil.copy2(src, tmp)
+        tmp.replace(dest)
+    index[sha] = dest.name
+
+# objects.tsv column #4 tallies, loaded once and kept current by process_pdf()
+_HASH_COUNTS: Optional[Counter] = None
+
+def load_hash_counts() -> Counter:
+    """Count objects.tsv column #4 (SHA256), skipping the header."""
+    return count_hash_column(OBJECTS_TSV, skip_header=True)
+
+def count_hash_column(path: Path, skip_header: bool) -> Counter:
+    """Count column #4 (SHA256) of an objects.tsv-shaped file.
+
+    Works on the raw bytes of a memory map and slices out only column #4, so a
+    cold start over a large ledger does not split and decode every column.
+    """
+    raw = Counter()
+    if not path.exists() or path.stat().st_size == 0:
+        return Counter()
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if skip_header:
+            mm.readline()
+        for line in iter(mm.readline, b""):
+            i = line.find(b"\t")
+            if i >= 0:
+                i = line.find(b"\t", i + 1)
+            if i >= 0:
+                i = line.find(b"\t", i + 1)
+            if i < 0:
+                continue  # fewer than 4 columns
+            j = line.find(b"\t", i + 1)
+            h = line[i + 1:j] if j >= 0 else line[i + 1:].rstrip(b"\r\n")
+            if h:
+                raw[h] += 1
+    counts = Counter()
+    for h, c in raw.items():
+        counts[h.decode("utf-8", errors="ignore")] += c
+    return counts
+
+def hash_counts() -> Counter:
+    """Cached per-hash row counts (read from objects.tsv on first use)."""
+    global _HASH_COUNTS
+    if _HASH_COUNTS is None:
+        _HASH_COUNTS = load_hash_counts()
+    return _HASH_COUNTS
 
 def update_hash_counts() -> None:
-    """Rebuild hash-count.tsv from objects.tsv column #4 (skip header)."""
-    if not OBJECTS_TSV.exists():
-        HASH_COUNT_TSV.write_text("", encoding="utf-8")
-        return
-    counts = Counter()
-    with OBJECTS_TSV.open("r", encoding="utf-8", errors="ignore") as f:
-        first = True
-        for line in f:
-            if first:
-                first = False
-                continue
-            parts = line.rstrip("\n").split("\t")
-            if len(parts) >= 4 and parts[3]:
-                counts[parts[3]] += 1
+    """Rewrite hash-count.tsv from the in-memory counts (atomic replace)."""
     # Sort by count desc, then hash
-    rows = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
-    with HASH_COUNT_TSV.open("w", encoding="utf-8", newline="") as out:
+    rows = sorted(hash_counts().items(), key=lambda kv: (-kv[1], kv[0]))
+    tmp = HASH_COUNT_TSV.with_suffix(".tsv.tmp")
+    with tmp.open("w", encoding="utf-8", newline="") as out:
         for h, c in rows:
             out.write(f"{h}\t{c}\n")
+    tmp.replace(HASH_COUNT_TSV)
 
 def extract_with_mutool(pdf_path: Path, outdir: Path) -> None:
+    """Explode pdf_path into outdir with a single mutool run (mutool extracts into its cwd)."""
     outdir.mkdir(parents=True, exist_ok=True)
-    rc, out, err = run_cmd(["mutool", "extract", str(pdf_path)])
-    # mutool extracts into cwd; run in outdir
+    # Drop objects left by an earlier extraction: mutool would rewrite them in place,
+    # and any that are hard-linked into hashed-objects/ would change there too.
+    for entry in iter_objects(outdir):
+        os.unlink(entry.path)
+    rc, out, err = run_cmd(["mutool", "extract", str(pdf_path.absolute())], cwd=outdir)
     if rc != 0:
-        # retry by forcing cwd to outdir (Windows often needs cwd control)
-        try:
-            proc = subprocess.run(["mutool", "extract", str(pdf_path)], cwd=str(outdir), capture_output=True, text=True)
-            if proc.returncode != 0:
-                raise RuntimeError(proc.stderr or "mutool extract failed")
-        except Exception as e:
-            raise RuntimeError(f"mutool extract failed: {e}")
-    else:
-        # if happened in current dir, move items into outdir (defensive)
-        # (Most builds require cwd control; above branch covers typical case)
-        pass
-
-def per_pdf_sig_and_meta(pdf_path: Path) -> Dict[str, str]:
-    sig = parse_pdfsig(pdf_path)
-    author, creator = get_author_creator(pdf_path)
-    sig["AUTHOR"] = author
-    sig["CREATOR"] = creator
-    return sig
+        raise RuntimeError(f"mutool extract failed: {err.strip() or f'exit code {rc}'}")
 
-def process_pdf(pdf_path: Path) -> None:
-    """Process one PDF end-to-end (idempotent)."""
+def process_pdf(pdf_path: Path) -> bool:
+    """Process one PDF end-to-end (idempotent); True if new rows were recorded."""
     wait_for_quiet_file(pdf_path)
     if not pdf_path.exists():
-        return
+        return False
 
     pdf_name = pdf_path.name
     print(f"→  Examining: {pdf_name}")
-    sha = file_sha256(pdf_path)
-    size = pdf_path.stat().st_size
-    mtime_epoch = int(pdf_path.stat().st_mtime)
+    st = pdf_path.stat()
+    size = st.st_size
+    mtime_epoch = int(st.st_mtime)
+
+    # the sample is only needed to skip on, or once the PDF is recorded; small files
+    # get both digests from one read
+    sha = sample = ""
+    if size <= 2 * SAMPLE_BYTES:
+        sha, sample = file_sha256_and_sample(pdf_path, size)
+    elif SAMPLE_SKIP:
+        sample = file_sample_sha(pdf_path, size)
+    if SAMPLE_SKIP and sample in processed_samples():
+        print(f"↷  Skipping (sample hash already processed): {pdf_name}")
+        return False
+    if not sha:
+        sha = file_sha256(pdf_path, size)
 
     if has_inflight(sha):
         print(f"↷  Skipping (in-flight): {pdf_name}")
-        return
+        return False
 
-    processed_shas = load_processed_shas()
-    if sha in processed_shas:
+    if sha in processed_shas():
+        if sample and sample not in processed_samples():
+            # recorded before the sample column existed: once backfilled, --sample-skip
+            # can skip this PDF without the full hash
+            record_sample(sha, sample)
         print(f"↷  Skipping (already processed): {pdf_name}")
-        return
+        return False
 
     safe = safe_name(pdf_name)
     outdir = OBJ_DIR / safe
     stamp = outdir / ".processed.sha"
     if stamp.exists() and stamp.read_text(encoding="utf-8", errors="ignore").strip() == sha:
-        if sha not in processed_shas:
-            record_processed(sha, pdf_name, size, mtime_epoch)
+        if sha not in processed_shas():
+            record_processed(sha, pdf_name, size, mtime_epoch, sample or file_sample_sha(pdf_path, size))
         print(f"↷  Skipping (stamp says processed): {pdf_name}")
-        return
+        return False
 
     # mark inflight
     mark_inflight(sha)
     try:
         print(f"→  Extracting objects from: {pdf_name}")
-        extract_with_mutool(pdf_path, outdir)
+        # pdfsig and exiftool only read the PDF, so they run alongside the extraction;
+        # all three are subprocess waits, so wall time is the slowest of them
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            f_sig = ex.submit(parse_pdfsig, pdf_path)
+            f_meta = ex.submit(get_author_creator, pdf_path)
+            f_ext = ex.submit(extract_with_mutool, pdf_path, outdir)
+            f_ext.result()
+            sigmeta = f_sig.result()
+            sigmeta["AUTHOR"], sigmeta["CREATOR"] = f_meta.result()
 
         # Per-PDF fields
         case_num, filing_type, filing_date = parse_mcro_fields(pdf_name)
-        sigmeta = per_pdf_sig_and_meta(pdf_path)
 
-        # Iterate extracted files
+        # Collect extracted files, then hash (and probe fonts) on a thread pool;
+        # hashlib and the font tools release the GIL, so this scales across cores.
+        objects = list(iter_objects(outdir))
+
+        # Rows and dedup copies stay on this thread (results arrive in listing order);
+        # objects.tsv is opened once per PDF with a large write buffer
         rows_added = 0
-        for root, _, files in os.walk(outdir):
-            for fn in files:
-                if fn == ".processed.sha":
-                    continue
-                obj_path = Path(root) / fn
-                rel = str(obj_path.relative_to(OBJ_DIR))
-                h = file_sha256(obj_path)
-                ext = obj_path.suffix.lower() if obj_path.suffix else ""
-                if len(ext) > 11:
-                    ext = ""
-                font_name = get_font_name(obj_path) if ext in FONT_EXTS else ""
+        stored = set()
+        counts = hash_counts()
+        with _OBJECTS_OUT.open("a", encoding="utf-8", newline="", buffering=1 << 20) as objects_fp, \
+                ThreadPoolExecutor(max_workers=HASH_WORKERS) as ex:
+            for obj_path, h, ext, font_name in ex.map(hash_object, objects):
+                rel = os.path.relpath(obj_path, OBJ_DIR_STR)
 
                 # Write row
                 row = [
@@ -402,97 +670,287 @@ def process_pdf(pdf_path: Path) -> None:
                     sigmeta.get("SIG1_TIME", ""), sigmeta.get("SIG2_TIME", ""), sigmeta.get("SIG3_TIME", ""), sigmeta.get("SIG4_TIME", ""),
                     sigmeta.get("SIG1_RANGE", ""), sigmeta.get("SIG2_RANGE", ""), sigmeta.get("SIG3_RANGE", ""), sigmeta.get("SIG4_RANGE", ""),
                 ]
-                with OBJECTS_TSV.open("a", encoding="utf-8", newline="") as f:
-                    f.write("\t".join(row) + "\n")
+                objects_fp.write("\t".join(row) + "\n")
+                counts[h] += 1
 
-                # Dedup store by hash
-                copy_object_if_new_by_hash(obj_path, h, HASHED_DIR)
+                # Dedup store by hash (once per hash within this PDF)
+                if h not in stored:
+                    copy_object_if_new_by_hash(obj_path, h, HASHED_DIR)
+                    stored.add(h)
                 rows_added += 1
 
-        # stamp + ledger + counts
+        # stamp + ledger (hash-count.tsv is rewritten by the caller)
         stamp.parent.mkdir(parents=True, exist_ok=True)
         stamp.write_text(sha + "\n", encoding="utf-8")
-        record_processed(sha, pdf_name, size, mtime_epoch)
-        update_hash_counts()
+        record_processed(sha, pdf_name, size, mtime_epoch, sample or file_sample_sha(pdf_path, size))
 
-        # Per-PDF row count (column #5 is pdf name)
-        per_pdf = 0
-        with OBJECTS_TSV.open("r", encoding="utf-8", errors="ignore") as f:
-            next(f)  # header
-            for line in f:
-                if not line.strip():
-                    continue
-                parts = line.rstrip("\n").split("\t")
-                if len(parts) >= 5 and parts[4] == pdf_name:
-                    per_pdf += 1
-        print(f"✔  Processed {pdf_name} → {per_pdf} object-rows now recorded for this PDF")
+        print(f"✔  Processed {pdf_name} → {rows_added} object-rows added")
+        return True
 
     finally:
         clear_inflight(sha)
 
 class PdfWatchHandler(FileSystemEventHandler):
-    def __init__(self, poll_quiet_sec: float = 0.5):
+    """Debounces watchdog events per PDF: a file is processed once it has seen no
+    created/modified/moved event for quiet_sec, instead of after a fixed sleep.
+
+    The (size, mtime) each path was processed at is remembered, so events that do not
+    change either (attributes, ACLs, last access, antivirus scans) do not re-hash it.
+    """
+
+    def __init__(self, quiet_sec: float = 0.5):
         super().__init__()
-        self.poll_quiet_sec = poll_quiet_sec
+        self.quiet_sec = quiet_sec
+        self._timers: Dict[str, threading.Timer] = {}
+        self._timers_lock = threading.Lock()
+        self._seen: Dict[str, Tuple[int, int]] = {}  # path -> (st_size, st_mtime_ns) when processed
+        self._process_lock = threading.Lock()  # one PDF at a time: the ledgers are shared
+        self._closed = False
+
+    def _schedule(self, path: str) -> None:
+        if not PDF_EXT_RE.search(os.path.basename(path)):
+            return
+        with self._timers_lock:
+            pending = self._timers.get(path)
+            if pending is not None:
+                pending.cancel()
+            timer = threading.Timer(self.quiet_sec, self._fire, args=(path,))
+            timer.daemon = True
+            self._timers[path] = timer
+            timer.start()
+
+    def _fire(self, path: str) -> None:
+        with self._timers_lock:
+            if self._timers.get(path) is not threading.current_thread():
+                return  # superseded by a later event
+            del self._timers[path]
+        with self._process_lock:
+            if self._closed:
+                return  # left _timers before close() could cancel it
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                return
+            # stat before processing: a change made meanwhile fires again and differs
+            key = (st.st_size, st.st_mtime_ns)
+            if self._seen.get(path) == key:
+                return
+            if process_pdf(Path(path)):
+                update_hash_counts()
+            self._seen[path] = key
 
     def on_created(self, event):
-        if event.is_directory:
-            return
-        p = Path(event.src_path)
-        if PDF_EXT_RE.search(p.name):
-            time.sleep(self.poll_quiet_sec)
-            process_pdf(p)
+        if not event.is_directory:
+            self._schedule(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._schedule(event.src_path)
 
     def on_moved(self, event):
-        if event.is_directory:
-            return
-        p = Path(event.dest_path)
-        if PDF_EXT_RE.search(p.name):
-            time.sleep(self.poll_quiet_sec)
-            process_pdf(p)
+        if not event.is_directory:
+            self._schedule(event.dest_path)
+
+    def close(self) -> None:
+        """Drop pending (still settling) PDFs and wait for one being processed."""
+        with self._timers_lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+        with self._process_lock:
+            self._closed = True
+
+def _init_scan_worker(sample_skip: bool, hash_workers: int, inflight: set) -> None:
+    """Catch-up worker initializer (workers are spawned, not forked, on Windows)."""
+    global SAMPLE_SKIP, HASH_WORKERS, _HASH_COUNTS, _INFLIGHT_AT_START
+    SAMPLE_SKIP = sample_skip
+    _INFLIGHT_AT_START = inflight
+    HASH_WORKERS = hash_workers  # the workers share the CPUs, and the font-tool forks with them
+    _HASH_COUNTS = Counter()  # the parent counts merged rows; don't load objects.tsv here
+
+def _scan_worker(tasks: List[Tuple[int, str]]) -> bool:
+    """Process PDFs in a catch-up worker, one after another, each writing to its own part files.
+
+    The PDFs of one call share a pdf-objects/<safe>/ dir, so they must not run in parallel.
+    """
+    global _OBJECTS_OUT, _PROCESSED_OUT, _FONT_NAMES_OUT, _SAMPLES_OUT
+    processed = False
+    for idx, pdf_path in tasks:
+        _OBJECTS_OUT = SCAN_PARTS_DIR / f"{idx:06d}.objects.tsv"
+        _PROCESSED_OUT = SCAN_PARTS_DIR / f"{idx:06d}.processed.tsv"
+        _FONT_NAMES_OUT = SCAN_PARTS_DIR / f"{idx:06d}.font-names.tsv"
+        _SAMPLES_OUT = SCAN_PARTS_DIR / f"{idx:06d}.samples.tsv"
+        processed = process_pdf(Path(pdf_path)) or processed
+    return processed
+
+def _append_file(src: Path, dest: Path) -> None:
+    with src.open("rb") as inp, dest.open("ab") as out:
+        shutil.copyfileobj(inp, out, 1 << 20)
+
+def merge_scan_parts() -> bool:
+    """Fold catch-up part files into the ledgers in PDF order; True if rows were added.
+
+    A PDF's rows are taken only once its processed part exists (record_processed runs
+    last), and a PDF whose SHA is already in the ledger -- the same content under
+    another name, handled by another worker -- is dropped, as a serial pass would skip it.
+    """
+    global _FONT_CACHE
+    if not SCAN_PARTS_DIR.exists():
+        return False
+    counts = hash_counts()  # load before appending, or merged rows would count twice
+    added = False
+    # workers probe a shared font each, so keep only names not yet in font-names.tsv
+    if _FONT_CACHE is None:
+        _FONT_CACHE = load_font_cache()
+    with FONT_NAMES_TSV.open("a", encoding="utf-8") as f:
+        for part in sorted(SCAN_PARTS_DIR.glob("*.font-names.tsv")):
+            for sha, name in load_font_cache(part).items():
+                if sha not in _FONT_CACHE:
+                    _FONT_CACHE[sha] = name
+                    f.write(f"{sha}\t{name}\n")
+    for part in sorted(SCAN_PARTS_DIR.glob("*.samples.tsv")):
+        for line in part.read_text(encoding="utf-8").splitlines():
+            sample, _, sha = line.partition("\t")
+            if sample and sample not in processed_samples():
+                record_sample(sha, sample)
+    for part in sorted(SCAN_PARTS_DIR.glob("*.processed.tsv")):
+        objects_part = part.with_name(part.name.replace(".processed.", ".objects."))
+        for line in part.read_text(encoding="utf-8").splitlines():
+            cols = line.split("\t")
+            sha = cols[0]
+            if sha in processed_shas():
+                print(f"↷  Dropping duplicate of an already-processed PDF: {cols[1] if len(cols) > 1 else sha}")
+                continue
+            if objects_part.exists():
+                _append_file(objects_part, OBJECTS_TSV)
+                counts.update(count_hash_column(objects_part, skip_header=False))
+                added = True
+            with PROCESSED_TSV.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            processed_shas().add(sha)
+            if len(cols) >= 6 and cols[5]:
+                processed_samples().add(cols[5])
+    shutil.rmtree(SCAN_PARTS_DIR, ignore_errors=True)
+    return added
+
+def scan_parallel(pdfs: List[Path], jobs: int) -> bool:
+    """Process PDFs on a process pool, then merge their part files; True if rows were added."""
+    # safe_name() is not injective ("a b.pdf" and "a_b.pdf"), and PDFs sharing an
+    # extraction dir would clear and hash each other's objects: one task per dir
+    groups: Dict[str, List[Tuple[int, str]]] = {}
+    for i, p in enumerate(pdfs):
+        groups.setdefault(safe_name(p.name), []).append((i, str(p)))
+    workers = min(jobs, len(groups))
+    if sys.platform == "win32":
+        workers = min(workers, 61)  # ProcessPoolExecutor raises ValueError above 61 on Windows
+    SCAN_PARTS_DIR.mkdir(parents=True, exist_ok=True)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_scan_worker,
+                                 initargs=(SAMPLE_SKIP, max(1, HASH_WORKERS // workers),
+                                           {p.stem for p in INFLIGHT_DIR.glob("*.lock")})) as ex:
+            list(ex.map(_scan_worker, groups.values()))
+    finally:
+        _HASHED_INDEX.clear()  # workers stored objects; relist on next use
+        added = merge_scan_parts()
+    return added
 
-def scan_once() -> None:
+def scan_once(jobs: int = 1) -> None:
     print(f"Scanning for unprocessed PDFs in: {PDF_DIR}")
-    if not PDF_DIR.exists():
+    # leftovers of an interrupted parallel run go in first, whatever this run's --jobs;
+    # otherwise process_pdf() would find their stamps and record them without their rows
+    merge_scan_parts()
+    pdfs = []
+    if PDF_DIR.exists():
+        pdfs = [p for p in sorted(PDF_DIR.iterdir()) if p.is_file() and PDF_EXT_RE.search(p.name)]
+    if not pdfs:
         print("… no PDFs found.")
-        return
-    matched = False
-    for p in sorted(PDF_DIR.iterdir()):
-        if p.is_file() and PDF_EXT_RE.search(p.name):
-            matched = True
+    if jobs > 1 and len(pdfs) > 1:
+        scan_parallel(pdfs, jobs)
+    else:
+        for p in pdfs:
             process_pdf(p)
-    if not matched:
-        print("… no PDFs found.")
+    # rewritten on every pass, not only when rows were added, so a missing or stale
+    # hash-count.tsv is rebuilt from objects.tsv
+    update_hash_counts()
     print("↺  hash-count.tsv updated.")
 
-def monitor_loop(poll_interval: float = 5.0) -> None:
+def start_observer(handler: "PdfWatchHandler", poll_interval: float, force_polling: bool = False):
+    """Start a native watchdog observer; use a PollingObserver if forced or native events fail."""
+    if not force_polling:
+        observer = Observer()
+        observer.schedule(handler, str(PDF_DIR), recursive=False)
+        try:
+            observer.start()
+            return observer
+        except OSError as e:
+            # e.g. inotify watch limit reached, or a filesystem without change notifications
+            print(f"NOTE: native file events unavailable ({e}); falling back to polling.", file=sys.stderr)
+    print(f"NOTE: polling '{PDF_DIR}' every {poll_interval:g}s.")
+    observer = PollingObserver(timeout=poll_interval)
+    observer.schedule(handler, str(PDF_DIR), recursive=False)
+    observer.start()
+    return observer
+
+def pdf_mtimes() -> Dict[str, float]:
+    """Map each PDF directly under PDF_DIR to its mtime (one directory read)."""
+    found = {}
+    try:
+        with os.scandir(PDF_DIR) as it:
+            for entry in it:
+                if entry.is_file() and PDF_EXT_RE.search(entry.name):
+                    try:
+                        found[entry.path] = entry.stat().st_mtime
+                    except OSError:
+                        pass  # vanished between listing and stat
+    except FileNotFoundError:
+        pass
+    return found
+
+def monitor_loop(poll_interval: float = 5.0, force_polling: bool = False,
+                 known: Optional[Dict[str, float]] = None) -> None:
+    """Watch PDF_DIR; known is a pdf_mtimes() snapshot taken before the catch-up pass."""
     print(f"🔎 Monitoring '{PDF_DIR}' for new PDFs… (Ctrl+C to stop)")
     if HAS_WATCHDOG:
-        observer = Observer()
         handler = PdfWatchHandler()
-        observer.schedule(handler, str(PDF_DIR), recursive=False)
-        observer.start()
+        observer = start_observer(handler, poll_interval, force_polling)
         try:
             while True:
                 time.sleep(1.0)
         except KeyboardInterrupt:
             observer.stop()
         observer.join()
+        handler.close()
     else:
         print(f"NOTE: watchdog not installed. Polling every {poll_interval:.0f}s.")
+        # Files in the pre-catch-up snapshot were handled by that pass; afterwards
+        # only new or modified files are examined.
+        seen = known if known is not None else pdf_mtimes()
         try:
             while True:
-                scan_once()
                 time.sleep(poll_interval)
+                current = pdf_mtimes()
+                processed = False
+                for path in sorted(current):
+                    if seen.get(path) != current[path]:
+                        processed = process_pdf(Path(path)) or processed
+                seen = current
+                if processed:
+                    update_hash_counts()
         except KeyboardInterrupt:
             pass
 
 def main():
     parser = argparse.ArgumentParser(description="PDF Object Hasher (PyInstaller-ready)")
     parser.add_argument("-m", "--monitor", action="store_true", help="Catch-up, then watch ./pdf/ for new PDFs")
-    parser.add_argument("--poll", type=float, default=5.0, help="Polling seconds when watchdog is unavailable (default 5)")
+    parser.add_argument("--poll", type=float, default=5.0, help="Polling seconds when watchdog is unavailable or polling is forced (default 5)")
+    parser.add_argument("--force-polling", action="store_true", help="Use watchdog's polling observer (e.g. ./pdf/ on a network share)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="PDFs processed in parallel during catch-up (default: CPU count; 1 = one at a time)")
+    parser.add_argument("--sample-skip", action="store_true", help="Skip PDFs whose first/last 1 MiB + size match an already-processed PDF, without hashing them in full")
     args = parser.parse_args()
 
+    global SAMPLE_SKIP
+    SAMPLE_SKIP = args.sample_skip
+
     # Core external tools
     need_tool("mutool", ["--version"])
     # Optional tools for enriched metadata
@@ -502,9 +960,11 @@ def main():
     need_tool("fc-scan", ["-h"])
 
     ensure_layout()
-    scan_once()
+    known = pdf_mtimes() if args.monitor else None
+    scan_once(args.jobs)
     if args.monitor:
-        monitor_loop(args.poll)
+        monitor_loop(args.poll, args.force_polling, known)
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # PyInstaller: catch-up workers re-launch the exe
     main()